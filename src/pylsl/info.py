@@ -1,9 +1,61 @@
 import ctypes
+import hashlib
+import logging
+import struct
 import typing
+from contextlib import suppress
 
-from .lib import lib, string2fmt, cf_float32
+from .lib import lib, string2fmt, cf_float32, decode_c_str
 from .util import IRREGULAR_RATE
 
+logger = logging.getLogger(__name__)
+
+
+def _generate_source_id(
+    name: str,
+    type: str,
+    channel_count: int,
+    nominal_srate: float,
+    channel_format: int,
+) -> str:
+    """Derive a default source_id from the core stream properties.
+
+    The built-in hash() is randomized per interpreter process, which would
+    defeat the purpose of the source_id (recovering a stream after the
+    providing app restarts). A keyless blake2b digest over the properties
+    is fast on such short input and stable across processes and machines.
+
+    The derivation is a documented contract so that other processes (or
+    implementations in other languages) can reproduce the id: hash the
+    UTF-8 encoded name, a NUL byte, the UTF-8 encoded type, and the
+    little-endian packing of (channel_count as int32, nominal_srate as
+    float64, channel_format as int32) with blake2b at an 8-byte digest
+    size, then render the digest as its 16-character lowercase hex form.
+    """
+    payload = b"%b\0%b%b" % (
+        name.encode("utf-8"),
+        type.encode("utf-8"),
+        struct.pack("<idi", channel_count, nominal_srate, channel_format),
+    )
+    h = hashlib.blake2b(payload, digest_size=8)
+    return h.hexdigest()
+
+
+# raw-handle traversal primitives: internal tree walks use the prototyped
+# C functions directly on the void* handles so that visiting a node does
+# not allocate an XMLElement wrapper per hop
+_child = lib.lsl_child
+_first_child = lib.lsl_first_child
+_next_sibling = lib.lsl_next_sibling
+_empty = lib.lsl_empty
+_value = lib.lsl_value
+
+# frequently used XML tag names, encoded once at module load instead of
+# per traversal
+_TAG_CHANNELS = b"channels"
+_TAG_CHANNEL = b"channel"
+_NAME_TAGS = {"label": b"label", "type": b"type", "unit": b"unit"}
+
 
 class StreamInfo:
     """The StreamInfo object stores the declaration of a data stream.
@@ -63,8 +115,12 @@ class StreamInfo:
                      recover from failure even after the serving app, device or
                      computer crashes (just by finding a stream with the same
                      source id on the network again). If the provided value is None
-                     then a source id will be generated automatically from a hash of
-                     the other arguments. If recovery is not desired, for example
+                     then a source id will be generated automatically from a
+                     deterministic hash of the other arguments (see
+                     _generate_source_id); the result is stable across
+                     interpreter runs and machines, so a restarted app with the
+                     same core properties reclaims the same id. If recovery is
+                     not desired, for example
                      when a disconnection should raise an error, set the source_id
                      to "" (empty string) . (default None)
         """
@@ -74,33 +130,44 @@ class StreamInfo:
             if isinstance(channel_format, str):
                 channel_format = string2fmt[channel_format]
             if source_id is None:
-                source_id = str(
-                    hash((name, type, channel_count, nominal_srate, channel_format))
+                source_id = _generate_source_id(
+                    name, type, channel_count, nominal_srate, channel_format
                 )
-                print(
-                    f"Generated source_id: '{source_id}' for StreamInfo with name '{name}', type '{type}', "
-                    f"channel_count {channel_count}, nominal_srate {nominal_srate}, "
-                    f"and channel_format {channel_format}."
+                logger.debug(
+                    "Generated source_id: '%s' for StreamInfo with name '%s', "
+                    "type '%s', channel_count %s, nominal_srate %s, "
+                    "and channel_format %s.",
+                    source_id,
+                    name,
+                    type,
+                    channel_count,
+                    nominal_srate,
+                    channel_format,
                 )
             self.obj = lib.lsl_create_streaminfo(
-                ctypes.c_char_p(str.encode(name)),
-                ctypes.c_char_p(str.encode(type)),
+                name.encode("utf-8"),
+                type.encode("utf-8"),
                 channel_count,
                 ctypes.c_double(nominal_srate),
                 channel_format,
-                ctypes.c_char_p(str.encode(source_id)),
+                source_id.encode("utf-8"),
             )
             self.obj = ctypes.c_void_p(self.obj)
             if not self.obj:
-                raise RuntimeError("could not create stream description " "object.")
+                raise RuntimeError("could not create stream description object.")
+        # per-instance caches; the core properties are constant for the
+        # lifetime of the stream, so each crosses into liblsl at most once
+        self._name = None
+        self._type = None
+        self._channel_count = None
+        self._nominal_srate = None
+        self._channel_format = None
+        self._source_id = None
 
     def __del__(self):
         """Destroy a previously created StreamInfo object."""
-        # noinspection PyBroadException
-        try:
+        with suppress(Exception):
             lib.lsl_destroy_streaminfo(self.obj)
-        except Exception as e:
-            print(f"StreamInfo deletion triggered error: {e}")
 
     # === Core Information (assigned at construction) ===
 
@@ -115,7 +182,9 @@ class StreamInfo:
         the recording app or experimenter).
 
         """
-        return lib.lsl_get_name(self.obj).decode("utf-8")
+        if self._name is None:
+            self._name = decode_c_str(lib.lsl_get_name(self.obj))
+        return self._name
 
     def type(self) -> str:
         """Content type of the stream.
@@ -128,7 +197,9 @@ class StreamInfo:
         content types is preferred.
 
         """
-        return lib.lsl_get_type(self.obj).decode("utf-8")
+        if self._type is None:
+            self._type = decode_c_str(lib.lsl_get_type(self.obj))
+        return self._type
 
     def channel_count(self) -> int:
         """Number of channels of the stream.
@@ -137,7 +208,9 @@ class StreamInfo:
         all samples.
 
         """
-        return lib.lsl_get_channel_count(self.obj)
+        if self._channel_count is None:
+            self._channel_count = lib.lsl_get_channel_count(self.obj)
+        return self._channel_count
 
     def nominal_srate(self) -> float:
         """Sampling rate of the stream, according to the source (in Hz).
@@ -153,7 +226,9 @@ class StreamInfo:
         sampling rate was close to the specs of the device.
 
         """
-        return lib.lsl_get_nominal_srate(self.obj)
+        if self._nominal_srate is None:
+            self._nominal_srate = lib.lsl_get_nominal_srate(self.obj)
+        return self._nominal_srate
 
     def channel_format(self) -> int:
         """Channel format of the stream.
@@ -162,7 +237,9 @@ class StreamInfo:
         offer multiple time-synched streams each with its own format.
 
         """
-        return lib.lsl_get_channel_format(self.obj)
+        if self._channel_format is None:
+            self._channel_format = lib.lsl_get_channel_format(self.obj)
+        return self._channel_format
 
     def source_id(self) -> str:
         """Unique identifier of the stream's source, if available.
@@ -173,7 +250,9 @@ class StreamInfo:
         back online.
 
         """
-        return lib.lsl_get_source_id(self.obj).decode("utf-8")
+        if self._source_id is None:
+            self._source_id = decode_c_str(lib.lsl_get_source_id(self.obj))
+        return self._source_id
 
     # === Hosting Information (assigned when bound to an outlet/inlet) ===
 
@@ -198,7 +277,7 @@ class StreamInfo:
         after a re-start).
 
         """
-        return lib.lsl_get_uid(self.obj).decode("utf-8")
+        return decode_c_str(lib.lsl_get_uid(self.obj))
 
     def session_id(self) -> str:
         """Session ID for the given stream.
@@ -211,11 +290,11 @@ class StreamInfo:
         Network Connectivity in the LSL wiki).
 
         """
-        return lib.lsl_get_session_id(self.obj).decode("utf-8")
+        return decode_c_str(lib.lsl_get_session_id(self.obj))
 
     def hostname(self) -> str:
         """Hostname of the providing machine."""
-        return lib.lsl_get_hostname(self.obj).decode("utf-8")
+        return decode_c_str(lib.lsl_get_hostname(self.obj))
 
     # === Data Description (can be modified) ===
     def desc(self) -> "XMLElement":
@@ -251,7 +330,36 @@ class StreamInfo:
            sub-elements.
 
         """
-        return lib.lsl_get_xml(self.obj).decode("utf-8")
+        return decode_c_str(lib.lsl_get_xml(self.obj))
+
+    @staticmethod
+    def from_xml(xml: str) -> "StreamInfo":
+        """Recreate a StreamInfo from its XML representation.
+
+        The given string must be a full stream_info document as produced by
+        as_xml(). Together with as_xml() this allows serialization
+        round-trips without involving an outlet or the network.
+
+        """
+        handle = lib.lsl_streaminfo_from_xml(xml.encode("utf-8"))
+        if not handle:
+            raise RuntimeError("could not parse stream description from XML.")
+        return StreamInfo(handle=handle)
+
+    def copy(self) -> "StreamInfo":
+        """Create an independent copy of this StreamInfo.
+
+        The copy duplicates the underlying liblsl object, including the
+        extended description, so it can be modified without affecting the
+        original. This is cheaper than rebuilding an equivalent StreamInfo
+        from scratch (or round-tripping through as_xml()) when reusing a
+        fully populated description as a template.
+
+        """
+        handle = lib.lsl_copy_streaminfo(self.obj)
+        if not handle:
+            raise RuntimeError("could not copy stream description object.")
+        return StreamInfo(handle=handle)
 
     def get_channel_labels(self) -> typing.Optional[list[typing.Optional[str]]]:
         """Get the channel names in the description.
@@ -269,7 +377,7 @@ class StreamInfo:
                 the ``desc`` property is tempered with outside of the defined getter and
                 setter.
         """
-        return self._get_channel_info("label")
+        return self.get_channel_info(("label",))["label"]
 
     def get_channel_types(self) -> typing.Optional[list[typing.Optional[str]]]:
         """Get the channel types in the description.
@@ -287,7 +395,7 @@ class StreamInfo:
                 the ``desc`` property is tempered with outside of the defined getter and
                 setter.
         """
-        return self._get_channel_info("type")
+        return self.get_channel_info(("type",))["type"]
 
     def get_channel_units(self) -> typing.Optional[list[typing.Optional[str]]]:
         """Get the channel units in the description.
@@ -305,30 +413,65 @@ class StreamInfo:
                 the ``desc`` property is tempered with outside of the defined getter and
                 setter.
         """
-        return self._get_channel_info("unit")
-
-    def _get_channel_info(self, name) -> typing.Optional[list[typing.Optional[str]]]:
-        """Get the 'channel/name' element in the XML tree."""
-        if self.desc().child("channels").empty():
-            return None
-        ch_infos = list()
-        channels = self.desc().child("channels")
-        ch = channels.child("channel")
-        while not ch.empty():
-            ch_info = ch.child(name).first_child().value()
-            if len(ch_info) != 0:
-                ch_infos.append(ch_info)
-            else:
-                ch_infos.append(None)
-            ch = ch.next_sibling()
-        if all(ch_info is None for ch_info in ch_infos):
-            return None
-        if len(ch_infos) != self.channel_count():
-            print(
-                f"The stream description contains {len(ch_infos)} elements for "
-                f"{self.channel_count()} channels.",
-            )
-        return ch_infos
+        return self.get_channel_info(("unit",))["unit"]
+
+    def get_channel_info(
+        self, fields: typing.Sequence[str] = ("label", "type", "unit")
+    ) -> dict[str, typing.Optional[list[typing.Optional[str]]]]:
+        """Get multiple 'channel/...' fields in a single pass over the tree.
+
+        Walking the channels subtree once per requested field is wasteful when
+        several fields are needed (e.g. labels, types and units in sequence),
+        so all requested fields are extracted per channel node while the tree
+        is traversed only once.
+
+        Parameters
+        ----------
+        fields : sequence of str
+            Names of the per-channel elements to extract, e.g.
+            ``("label", "type", "unit")``.
+
+        Returns
+        -------
+        infos : dict
+            Mapping of field name to the list of per-channel values (``None``
+            entries for missing values), or to ``None`` if the field is not
+            set on any channel or the description contains no channels.
+
+        """
+        infos: dict[str, typing.Optional[list[typing.Optional[str]]]] = {
+            field: None for field in fields
+        }
+        channels = _child(lib.lsl_get_desc(self.obj), _TAG_CHANNELS)
+        if _empty(channels):
+            return infos
+        values: dict[str, list[typing.Optional[str]]] = {field: [] for field in fields}
+        tags = [
+            (field, _NAME_TAGS.get(field) or field.encode("utf-8")) for field in fields
+        ]
+        n_set = dict.fromkeys(fields, 0)
+        ch = _child(channels, _TAG_CHANNEL)
+        while not _empty(ch):
+            for field, tag in tags:
+                value = decode_c_str(_value(_first_child(_child(ch, tag))))
+                if value:
+                    values[field].append(value)
+                    n_set[field] += 1
+                else:
+                    values[field].append(None)
+            ch = _next_sibling(ch)
+        channel_count = self.channel_count()
+        for field, ch_infos in values.items():
+            if n_set[field] == 0:
+                continue
+            if len(ch_infos) != channel_count:
+                logger.warning(
+                    "The stream description contains %d elements for %d channels.",
+                    len(ch_infos),
+                    channel_count,
+                )
+            infos[field] = ch_infos
+        return infos
 
     def set_channel_labels(self, labels: list[str]):
         """Set the channel names in the description. Existing labels are overwritten.
@@ -377,37 +520,55 @@ class StreamInfo:
         """
         if isinstance(units, (int, str)):
             units = [units] * self.channel_count()
-        else:  # iterable
-            units = [
-                str(int(unit)) if isinstance(unit, int) else unit for unit in units
-            ]
+        else:
+            # materialize first so a generator argument survives the probe
+            units = list(units)
+            if all(type(unit) is int for unit in units):
+                # uniform integer units convert through the C-level map path
+                # without a per-element isinstance branch
+                units = list(map(str, units))
+            else:  # mixed iterable
+                units = [
+                    str(int(unit)) if isinstance(unit, int) else unit for unit in units
+                ]
         self._set_channel_info(units, "unit")
 
     def _set_channel_info(self, ch_infos, name: str) -> None:
         """Set the 'channel/name' element in the XML tree."""
-        if len(ch_infos) != self.channel_count():
+        channel_count = self.channel_count()
+        if len(ch_infos) != channel_count:
             raise ValueError(
                 f"The number of provided channel {name} {len(ch_infos)} "
-                f"must match the number of channels {self.channel_count()}."
+                f"must match the number of channels {channel_count}."
             )
 
-        channels = StreamInfo._add_first_node(self.desc, "channels")
+        # normalize to str once, so the per-channel code below and
+        # _set_description_node never re-run the isinstance branch
+        ch_infos = [
+            str(int(ch_info)) if isinstance(ch_info, int) else str(ch_info)
+            for ch_info in ch_infos
+        ]
+        channels = StreamInfo._add_first_node(self.desc(), "channels")
         # fill the 'channel/name' element of the tree and overwrite existing values
         ch = channels.child("channel")
+        append_channel = channels.append_child
         for ch_info in ch_infos:
-            ch = channels.append_child("channel") if ch.empty() else ch
-            StreamInfo._set_description_node(ch, {name: ch_info})
-            ch = ch.next_sibling()
+            if ch.empty():
+                # a freshly appended channel cannot have the child yet, so
+                # write the value directly instead of probing for it first
+                append_channel("channel").append_child_value(name, ch_info)
+            else:
+                StreamInfo._set_description_node(ch, {name: ch_info})
+                ch = ch.next_sibling()
         StreamInfo._prune_description_node(ch, channels)
 
     # -- Helper methods to interact with the XMLElement tree ---------------------------
     @staticmethod
-    def _add_first_node(desc, name: str) -> "XMLElement":
+    def _add_first_node(desc: "XMLElement", name: str) -> "XMLElement":
         """Add the first node in the description and return it."""
-        if desc().child(name).empty():
-            node = desc().append_child(name)
-        else:
-            node = desc().child(name)
+        node = desc.child(name)
+        if node.empty():
+            node = desc.append_child(name)
         return node
 
     @staticmethod
@@ -415,16 +576,17 @@ class StreamInfo:
         """Prune a node and remove outdated entries."""
         # this is useful in case the sinfo is tempered with and had more entries of type
         # 'node' than it should.
-        while not node.empty():
-            node_next = node.next_sibling()
-            parent.remove_child(node)
-            node = node_next
+        h, parent_h = node.e, parent.e
+        remove = lib.lsl_remove_child
+        while not _empty(h):
+            h_next = _next_sibling(h)
+            remove(parent_h, h)
+            h = h_next
 
     @staticmethod
     def _set_description_node(node, mapping):
-        """Set the key: value child(s) of a node."""
+        """Set the key: value child(s) of a node. Values must already be str."""
         for key, value in mapping.items():
-            value = str(int(value)) if isinstance(value, int) else str(value)
             if node.child(key).empty():
                 node.append_child_value(key, value)
             else:
@@ -442,23 +604,25 @@ class XMLElement:
 
     """
 
+    __slots__ = ("e",)
+
     def __init__(self, handle):
         """Construct new XML element from existing handle."""
         self.e = ctypes.c_void_p(handle)
 
     # === Tree Navigation ===
 
-    def first_child(self) -> "XMLElement":
+    def first_child(self, _first_child=lib.lsl_first_child) -> "XMLElement":
         """Get the first child of the element."""
-        return XMLElement(lib.lsl_first_child(self.e))
+        return XMLElement(_first_child(self.e))
 
     def last_child(self) -> "XMLElement":
         """Get the last child of the element."""
         return XMLElement(lib.lsl_last_child(self.e))
 
-    def child(self, name: str) -> "XMLElement":
+    def child(self, name: str, _child=lib.lsl_child) -> "XMLElement":
         """Get a child with a specified name."""
-        return XMLElement(lib.lsl_child(self.e, str.encode(name)))
+        return XMLElement(_child(self.e, name.encode("utf-8")))
 
     def next_sibling(self, name: typing.Optional[str] = None) -> "XMLElement":
         """Get the next sibling in the children list of the parent node.
@@ -467,9 +631,9 @@ class XMLElement:
 
         """
         if name is None:
-            return XMLElement(lib.lsl_next_sibling(self.e))
+            return XMLElement(_next_sibling(self.e))
         else:
-            return XMLElement(lib.lsl_next_sibling_n(self.e, str.encode(name)))
+            return XMLElement(lib.lsl_next_sibling_n(self.e, name.encode("utf-8")))
 
     def previous_sibling(self, name: typing.Optional[str] = None) -> "XMLElement":
         """Get the previous sibling in the children list of the parent node.
@@ -481,7 +645,7 @@ class XMLElement:
         if name is None:
             return XMLElement(lib.lsl_previous_sibling(self.e))
         else:
-            return XMLElement(lib.lsl_previous_sibling_n(self.e, str.encode(name)))
+            return XMLElement(lib.lsl_previous_sibling_n(self.e, name.encode("utf-8")))
 
     def parent(self) -> "XMLElement":
         """Get the parent node."""
@@ -489,9 +653,9 @@ class XMLElement:
 
     # === Content Queries ===
 
-    def empty(self) -> bool:
+    def empty(self, _empty=lib.lsl_empty) -> bool:
         """Whether this node is empty."""
-        return bool(lib.lsl_empty(self.e))
+        return _empty(self.e)
 
     def is_text(self) -> bool:
         """Whether this is a text body (instead of an XML element).
@@ -499,15 +663,15 @@ class XMLElement:
         True both for plain char data and CData.
 
         """
-        return bool(lib.lsl_is_text(self.e))
+        return lib.lsl_is_text(self.e)
 
-    def name(self) -> str:
+    def name(self, _name=lib.lsl_name) -> str:
         """Name of the element."""
-        return lib.lsl_name(self.e).decode("utf-8")
+        return decode_c_str(_name(self.e))
 
-    def value(self) -> str:
+    def value(self, _value=lib.lsl_value) -> str:
         """Value of the element."""
-        return lib.lsl_value(self.e).decode("utf-8")
+        return decode_c_str(_value(self.e))
 
     def child_value(self, name: typing.Optional[str] = None) -> str:
         """Get child value (value of the first child that is text).
@@ -519,47 +683,49 @@ class XMLElement:
         if name is None:
             res = lib.lsl_child_value(self.e)
         else:
-            res = lib.lsl_child_value_n(self.e, str.encode(name))
-        return res.decode("utf-8")
+            res = lib.lsl_child_value_n(self.e, name.encode("utf-8"))
+        return decode_c_str(res)
 
     # === Modification ===
 
-    def append_child_value(self, name: str, value: str) -> "XMLElement":
+    def append_child_value(
+        self, name: str, value: str, _append=lib.lsl_append_child_value
+    ) -> "XMLElement":
         """Append a child node with a given name, which has a (nameless)
         plain-text child with the given text value."""
-        return XMLElement(
-            lib.lsl_append_child_value(self.e, str.encode(name), str.encode(value))
-        )
+        return XMLElement(_append(self.e, name.encode("utf-8"), value.encode("utf-8")))
 
     def prepend_child_value(self, name: str, value: str) -> "XMLElement":
         """Prepend a child node with a given name, which has a (nameless)
         plain-text child with the given text value."""
         return XMLElement(
-            lib.lsl_prepend_child_value(self.e, str.encode(name), str.encode(value))
+            lib.lsl_prepend_child_value(
+                self.e, name.encode("utf-8"), value.encode("utf-8")
+            )
         )
 
     def set_child_value(self, name: str, value: str) -> "XMLElement":
         """Set the text value of the (nameless) plain-text child of a named
         child node."""
         return XMLElement(
-            lib.lsl_set_child_value(self.e, str.encode(name), str.encode(value))
+            lib.lsl_set_child_value(self.e, name.encode("utf-8"), value.encode("utf-8"))
         )
 
     def set_name(self, name: str) -> bool:
         """Set the element's name. Returns False if the node is empty."""
-        return bool(lib.lsl_set_name(self.e, str.encode(name)))
+        return lib.lsl_set_name(self.e, name.encode("utf-8"))
 
-    def set_value(self, value: str) -> bool:
+    def set_value(self, value: str, _set_value=lib.lsl_set_value) -> bool:
         """Set the element's value. Returns False if the node is empty."""
-        return bool(lib.lsl_set_value(self.e, str.encode(value)))
+        return _set_value(self.e, value.encode("utf-8"))
 
-    def append_child(self, name: str) -> "XMLElement":
+    def append_child(self, name: str, _append=lib.lsl_append_child) -> "XMLElement":
         """Append a child element with the specified name."""
-        return XMLElement(lib.lsl_append_child(self.e, str.encode(name)))
+        return XMLElement(_append(self.e, name.encode("utf-8")))
 
     def prepend_child(self, name: str) -> "XMLElement":
         """Prepend a child element with the specified name."""
-        return XMLElement(lib.lsl_prepend_child(self.e, str.encode(name)))
+        return XMLElement(lib.lsl_prepend_child(self.e, name.encode("utf-8")))
 
     def append_copy(self, elem: "XMLElement") -> "XMLElement":
         """Append a copy of the specified element as a child."""
@@ -569,9 +735,13 @@ class XMLElement:
         """Prepend a copy of the specified element as a child."""
         return XMLElement(lib.lsl_prepend_copy(self.e, elem.e))
 
-    def remove_child(self, rhs: "XMLElement") -> None:
+    def remove_child(self, rhs: typing.Union["XMLElement", str]) -> None:
         """Remove a given child element, specified by name or as element."""
         if type(rhs) is XMLElement:
             lib.lsl_remove_child(self.e, rhs.e)
         else:
-            lib.lsl_remove_child_n(self.e, rhs)
+            self.remove_child_by_name(rhs)
+
+    def remove_child_by_name(self, name: str) -> None:
+        """Remove the first child element with the specified name."""
+        lib.lsl_remove_child_n(self.e, name.encode("utf-8"))
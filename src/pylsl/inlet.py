@@ -1,15 +1,27 @@
 import ctypes
+from collections import OrderedDict
 
-from .lib import lib, fmt2type, fmt2pull_sample, fmt2pull_chunk, cf_string
+import numpy as np
+
+from .lib import lib, fmt2type, fmt2numpy, fmt2pull_sample, fmt2pull_chunk, cf_string
 from .util import handle_error, FOREVER
 from .info import StreamInfo
 
 
 def free_char_p_array_memory(char_p_array, num_elements):
-    pointers = ctypes.cast(char_p_array, ctypes.POINTER(ctypes.c_void_p))
-    for p in range(num_elements):
-        if pointers[p] is not None:  # only free initialized pointers
-            lib.lsl_destroy_string(pointers[p])
+    # view the filled prefix as a typed array so iteration needs no per-index
+    # pointer arithmetic; the view borrows the original buffer's memory
+    pointers = (ctypes.c_void_p * num_elements).from_address(
+        ctypes.addressof(char_p_array)
+    )
+    destroy = lib.lsl_destroy_string
+    for p in pointers:
+        if p:  # only free initialized pointers
+            destroy(p)
+
+
+# how many distinct max_samples values to keep chunk buffers around for
+_MAX_CACHED_BUFFERS = 4
 
 
 class StreamInlet:
@@ -58,11 +70,10 @@ class StreamInlet:
                    flags. Use `proc_ALL` for all flags. (default proc_none).
         """
         if type(info) is list:
-            raise TypeError(
-                "description needs to be of type StreamInfo, " "got a list."
-            )
+            raise TypeError("description needs to be of type StreamInfo, got a list.")
+        # every inlet function declares c_void_p for its first argument, so
+        # the handle can be kept and passed as a plain int
         self.obj = lib.lsl_create_inlet(info.obj, max_buflen, max_chunklen, recover)
-        self.obj = ctypes.c_void_p(self.obj)
         if not self.obj:
             raise RuntimeError("could not create stream inlet.")
         if processing_flags > 0:
@@ -72,15 +83,64 @@ class StreamInlet:
         self.do_pull_sample = fmt2pull_sample[self.channel_format]
         self.do_pull_chunk = fmt2pull_chunk[self.channel_format]
         self.value_type = fmt2type[self.channel_format]
+        self._np_dtype = fmt2numpy[self.channel_format]
         self.sample_type = self.value_type * self.channel_count
         self.sample = self.sample_type()
-        self.buffers = {}
+        # bounded LRU of chunk buffers keyed by max_samples; preallocate the
+        # default size so the first pull_chunk call does not pay for it
+        self.buffers = OrderedDict()
+        self._alloc_buffers(1024)
+        # bounded like self.buffers: the from_buffer wrappers keep their
+        # dest_obj alive, so an unbounded cache would pin every destination
+        # buffer ever passed for the lifetime of the inlet
+        self._dest_cache = OrderedDict()
+        self._np_data = None
+        self._np_ts = None
+        # preallocated scalar boxes reused across pull calls; rebuilding
+        # these per call dominates the cost at kHz sample rates
+        self._errcode = ctypes.c_int()
+        self._errcode_ref = ctypes.byref(self._errcode)
+        self._c_timeout = ctypes.c_double()
+        self._c_max_values = ctypes.c_size_t()
+        self._c_max_samples = ctypes.c_size_t()
+        # typed pointer to the sample buffer, built once; the declared
+        # POINTER argtypes accept this (and plain arrays) but reject the
+        # untyped pointer that byref() would produce
+        self._sample_ref = ctypes.cast(self.sample, ctypes.POINTER(self.value_type))
+        # specialize the per-sample hot path for this inlet's format; the
+        # instance attribute shadows the generic method below. Subclasses
+        # that override pull_sample keep their override instead.
+        if type(self).pull_sample is StreamInlet.pull_sample:
+            self.pull_sample = self._make_pull_sample()
+
+    def _alloc_buffers(self, max_samples):
+        """Allocate and cache data/timestamp buffers for a chunk size.
+
+        The cache is kept small so callers that vary max_samples do not
+        accumulate retired buffers over the lifetime of the inlet.
+
+        """
+        # noinspection PyCallingNonCallable
+        buffers = (
+            (self.value_type * (max_samples * self.channel_count))(),
+            (ctypes.c_double * max_samples)(),
+        )
+        self.buffers[max_samples] = buffers
+        if len(self.buffers) > _MAX_CACHED_BUFFERS:
+            self.buffers.popitem(last=False)
+        return buffers
 
-    def __del__(self):
-        """Destructor. The inlet will automatically disconnect if destroyed."""
+    def __del__(self, _destroy=lib.lsl_destroy_inlet):
+        """Destructor. The inlet will automatically disconnect if destroyed.
+
+        The destroy function is captured as a default argument so
+        finalization still works during interpreter shutdown, when module
+        globals may already have been cleared.
+
+        """
         # noinspection PyBroadException
         try:
-            lib.lsl_destroy_inlet(self.obj)
+            _destroy(self.obj)
         except Exception:
             pass
 
@@ -191,17 +251,22 @@ class StreamInlet:
         else:
             assign_to = None
 
-        errcode = ctypes.c_int()
+        # hoist attribute lookups out of the hot path
+        errcode = self._errcode
+        c_timeout = self._c_timeout
+        errcode.value = 0
+        c_timeout.value = timeout
         timestamp = self.do_pull_sample(
             self.obj,
-            ctypes.byref(self.sample),
+            self._sample_ref,
             self.channel_count,
-            ctypes.c_double(timeout),
-            ctypes.byref(errcode),
+            c_timeout,
+            self._errcode_ref,
         )
         handle_error(errcode)
         if timestamp:
-            sample = [v for v in self.sample]
+            # slicing a ctypes array produces the list in one C call
+            sample = self.sample[:]
             if self.channel_format == cf_string:
                 sample = [v.decode("utf-8") for v in sample]
             if assign_to is not None:
@@ -210,6 +275,50 @@ class StreamInlet:
         else:
             return None, None
 
+    def _make_pull_sample(self):
+        """Build a pull_sample closure specialized for this inlet's format.
+
+        Everything a call touches is a closure local and the string-format
+        branch is resolved here instead of per call. The closure must not
+        reference self: assigning it to an instance attribute would
+        otherwise create a reference cycle that keeps the inlet alive.
+
+        """
+        obj = self.obj
+        pull = self.do_pull_sample
+        num_channels = self.channel_count
+        sample_buf = self.sample
+        sample_ref = self._sample_ref
+        errcode = self._errcode
+        errcode_ref = self._errcode_ref
+        c_timeout = self._c_timeout
+        is_string = self.channel_format == cf_string
+
+        def pull_sample(timeout=FOREVER, sample=None):
+            # support for the legacy API
+            if type(timeout) is list:
+                assign_to = timeout
+                timeout = sample if type(sample) is float else 0.0
+            else:
+                assign_to = None
+
+            errcode.value = 0
+            c_timeout.value = timeout
+            timestamp = pull(obj, sample_ref, num_channels, c_timeout, errcode_ref)
+            handle_error(errcode)
+            if timestamp:
+                sample = sample_buf[:]
+                if is_string:
+                    sample = [v.decode("utf-8") for v in sample]
+                if assign_to is not None:
+                    assign_to[:] = sample
+                return sample, timestamp
+            else:
+                return None, None
+
+        pull_sample.__doc__ = StreamInlet.pull_sample.__doc__
+        return pull_sample
+
     def pull_chunk(self, timeout=0.0, max_samples=1024, dest_obj=None):
         """Pull a chunk of samples from the inlet.
 
@@ -233,51 +342,194 @@ class StreamInlet:
         Throws a LostError if the stream source has been lost.
 
         """
-        # look up a pre-allocated buffer of appropriate length
+        # hoist attribute lookups out of the hot path
         num_channels = self.channel_count
         max_values = max_samples * num_channels
+        buffer_cache = self.buffers
 
-        if max_samples not in self.buffers:
-            # noinspection PyCallingNonCallable
-            self.buffers[max_samples] = (
-                (self.value_type * max_values)(),
-                (ctypes.c_double * max_samples)(),
-            )
+        # look up a pre-allocated buffer of appropriate length
+        buffers = buffer_cache.get(max_samples)
+        if buffers is None:
+            buffers = self._alloc_buffers(max_samples)
+        else:
+            buffer_cache.move_to_end(max_samples)
         if dest_obj is not None:
-            data_buff = (self.value_type * max_values).from_buffer(dest_obj)
+            # reuse the ctypes wrapper for a repeatedly-passed destination
+            # buffer; the wrapper keeps dest_obj alive, so its id stays valid
+            key = (id(dest_obj), max_values)
+            dest_cache = self._dest_cache
+            data_buff = dest_cache.get(key)
+            if data_buff is None:
+                data_buff = (self.value_type * max_values).from_buffer(dest_obj)
+                dest_cache[key] = data_buff
+                if len(dest_cache) > _MAX_CACHED_BUFFERS:
+                    dest_cache.popitem(last=False)
+            else:
+                dest_cache.move_to_end(key)
         else:
-            data_buff = self.buffers[max_samples][0]
-        ts_buff = self.buffers[max_samples][1]
+            data_buff = buffers[0]
+        ts_buff = buffers[1]
 
         # read data into it
-        errcode = ctypes.c_int()
+        errcode = self._errcode
+        c_timeout = self._c_timeout
+        c_max_values = self._c_max_values
+        c_max_samples = self._c_max_samples
+        errcode.value = 0
+        c_timeout.value = timeout
+        c_max_values.value = max_values
+        c_max_samples.value = max_samples
         # noinspection PyCallingNonCallable
         num_elements = self.do_pull_chunk(
             self.obj,
-            ctypes.byref(data_buff),
-            ctypes.byref(ts_buff),
-            ctypes.c_size_t(max_values),
-            ctypes.c_size_t(max_samples),
-            ctypes.c_double(timeout),
-            ctypes.byref(errcode),
+            data_buff,
+            ts_buff,
+            c_max_values,
+            c_max_samples,
+            c_timeout,
+            self._errcode_ref,
         )
         handle_error(errcode)
-        # return results (note: could offer a more efficient format in the
-        # future, e.g., a numpy array)
-        num_samples = num_elements / num_channels
+        num_samples = num_elements // num_channels
         if dest_obj is None:
-            samples = [
-                [data_buff[s * num_channels + c] for c in range(num_channels)]
-                for s in range(int(num_samples))
-            ]
             if self.channel_format == cf_string:
-                samples = [[v.decode("utf-8") for v in s] for s in samples]
-                free_char_p_array_memory(data_buff, max_values)
+                # decode in one flat pass, then slice into samples; only the
+                # num_elements strings actually returned need decoding/freeing
+                flat = [
+                    v.decode("utf-8") if v is not None else ""
+                    for v in data_buff[:num_elements]
+                ]
+                samples = [
+                    flat[s * num_channels : (s + 1) * num_channels]
+                    for s in range(num_samples)
+                ]
+                free_char_p_array_memory(data_buff, num_elements)
+            else:
+                # single C-level copy + C-implemented nested-list conversion
+                # instead of a Python loop over every scalar
+                samples = (
+                    np.frombuffer(data_buff, dtype=self._np_dtype, count=num_elements)
+                    .reshape(num_samples, num_channels)
+                    .tolist()
+                )
         else:
             samples = None
-        timestamps = [ts_buff[s] for s in range(int(num_samples))]
+        timestamps = np.frombuffer(
+            ts_buff, dtype=np.float64, count=num_samples
+        ).tolist()
         return samples, timestamps
 
+    def pull_chunk_np(self, timeout=0.0, max_samples=1024):
+        """Pull a chunk of samples into inlet-owned numpy arrays.
+
+        liblsl writes directly into a persistent numpy buffer, so no values
+        are boxed into Python objects and nothing is copied on the way out.
+
+        Keyword arguments:
+        timeout -- The timeout of the operation; if passed as 0.0, then only
+                   samples available for immediate pickup will be returned.
+                   (default 0.0)
+        max_samples -- Maximum number of samples to return. (default 1024)
+
+        Returns a tuple (samples, timestamps) where samples is a 2-D ndarray
+        of shape (n_samples, n_channels) and timestamps is a 1-D float64
+        ndarray. Both are views into buffers owned by the inlet that are
+        overwritten by the next pull_chunk_np call; copy them if they need
+        to outlive it.
+
+        Throws a LostError if the stream source has been lost. Raises a
+        ValueError for string-formatted streams, which have no fixed-width
+        sample representation.
+
+        """
+        if self.channel_format == cf_string:
+            raise ValueError(
+                "pull_chunk_np is not supported for string-formatted streams."
+            )
+        num_channels = self.channel_count
+        if self._np_data is None or self._np_data.shape[0] < max_samples:
+            self._np_data = np.empty((max_samples, num_channels), dtype=self._np_dtype)
+            self._np_ts = np.empty(max_samples, dtype=np.float64)
+        errcode = self._errcode
+        errcode.value = 0
+        self._c_timeout.value = timeout
+        self._c_max_values.value = max_samples * num_channels
+        self._c_max_samples.value = max_samples
+        num_elements = self.do_pull_chunk(
+            self.obj,
+            self._np_data.ctypes.data_as(ctypes.POINTER(self.value_type)),
+            self._np_ts.ctypes.data_as(ctypes.POINTER(ctypes.c_double)),
+            self._c_max_values,
+            self._c_max_samples,
+            self._c_timeout,
+            self._errcode_ref,
+        )
+        handle_error(errcode)
+        num_samples = num_elements // num_channels
+        return self._np_data[:num_samples], self._np_ts[:num_samples]
+
+    def pull_chunk_into(self, data_arr, ts_arr, timeout=0.0):
+        """Pull a chunk of samples into caller-owned numpy arrays.
+
+        Unlike dest_obj, which leaves the caller to trim the buffer, this
+        returns the number of samples written so the caller can slice the
+        arrays in O(1) without copying.
+
+        Keyword arguments:
+        data_arr -- A writable C-contiguous ndarray of shape
+                    (max_samples, n_channels) whose dtype matches the
+                    stream's channel format.
+        ts_arr -- A writable C-contiguous float64 ndarray of length
+                  max_samples to receive the timestamps.
+        timeout -- The timeout of the operation; if passed as 0.0, then only
+                   samples available for immediate pickup will be returned.
+                   (default 0.0)
+
+        Returns the number of samples written; only data_arr[:n] and
+        ts_arr[:n] are valid.
+
+        Throws a LostError if the stream source has been lost. Raises a
+        ValueError for string-formatted streams or mismatched buffers.
+
+        """
+        if self.channel_format == cf_string:
+            raise ValueError(
+                "pull_chunk_into is not supported for string-formatted streams."
+            )
+        num_channels = self.channel_count
+        if data_arr.dtype != self._np_dtype:
+            raise ValueError(
+                f"data_arr dtype ({data_arr.dtype}) does not match the "
+                f"stream's channel format dtype ({np.dtype(self._np_dtype)})."
+            )
+        if data_arr.ndim != 2 or data_arr.shape[1] != num_channels:
+            raise ValueError(
+                "data_arr must have shape (max_samples, " + str(num_channels) + ")."
+            )
+        if not data_arr.flags.c_contiguous or not ts_arr.flags.c_contiguous:
+            raise ValueError("data_arr and ts_arr must be C-contiguous.")
+        max_samples = data_arr.shape[0]
+        if ts_arr.dtype != np.float64 or ts_arr.size < max_samples:
+            raise ValueError(
+                "ts_arr must be a float64 array of at least max_samples elements."
+            )
+        errcode = self._errcode
+        errcode.value = 0
+        self._c_timeout.value = timeout
+        self._c_max_values.value = max_samples * num_channels
+        self._c_max_samples.value = max_samples
+        num_elements = self.do_pull_chunk(
+            self.obj,
+            data_arr.ctypes.data_as(ctypes.POINTER(self.value_type)),
+            ts_arr.ctypes.data_as(ctypes.POINTER(ctypes.c_double)),
+            self._c_max_values,
+            self._c_max_samples,
+            self._c_timeout,
+            self._errcode_ref,
+        )
+        handle_error(errcode)
+        return num_elements // num_channels
+
     def samples_available(self):
         """Query whether samples are currently available for immediate pickup.
 
@@ -4,6 +4,8 @@ import os
 import platform
 import struct
 
+import numpy as np
+
 
 # For up to 24-bit precision measurements in the appropriate physical unit (
 # e.g., microvolts). Integers from -16777216 to 16777216 are represented
@@ -69,6 +71,15 @@ def find_liblsl_libraries(verbose=False):
 
     libbasepath = os.path.dirname(__file__)
 
+    # one directory scan replaces a stat() syscall per candidate filename;
+    # the preference order below is then checked against the set in memory
+    try:
+        package_files = {
+            entry.name for entry in os.scandir(libbasepath) if entry.is_file()
+        }
+    except OSError:
+        package_files = set()
+
     # because there were quite a few errors with picking up old binaries
     # still lurking in the system or environment, we first search through all
     # prefix/suffix/bitness variants in the package itself, i.e. in libbasepath
@@ -78,12 +89,9 @@ def find_liblsl_libraries(verbose=False):
             for debugsuffix in ["", "-debug"]:
                 for bitness in ["", str(8 * struct.calcsize("P"))]:
                     if scope == "package":
-                        path = os.path.join(
-                            libbasepath,
-                            libprefix + "lsl" + bitness + debugsuffix + libsuffix,
-                        )
-                        if os.path.isfile(path):
-                            yield path
+                        libfile = libprefix + "lsl" + bitness + debugsuffix + libsuffix
+                        if libfile in package_files:
+                            yield os.path.join(libbasepath, libfile)
                     elif (scope == "system") and os_name not in [
                         "Windows",
                         "Microsoft",
@@ -131,6 +139,9 @@ if platform.system() == "Darwin":
 
 try:
     libpath = next(find_liblsl_libraries())
+    # CDLL (unlike PyDLL) releases the GIL for the duration of every C call,
+    # so blocking entry points such as lsl_wait_for_consumers or a pull with
+    # a long timeout do not stall other Python threads
     lib = ctypes.CDLL(libpath)
 except StopIteration:
     err_msg = (
@@ -151,26 +162,111 @@ except OSError:
     raise RuntimeError(err_msg + "\n " + __dload_msg)
 
 
-# set function return types where necessary
+# CPython can build a str directly from the C string returned by liblsl,
+# skipping the intermediate bytes object that a c_char_p restype would
+# materialize before .decode("utf-8") could run.
+_PyUnicode_FromStringAndSize = ctypes.pythonapi.PyUnicode_FromStringAndSize
+_PyUnicode_FromStringAndSize.restype = ctypes.py_object
+_PyUnicode_FromStringAndSize.argtypes = [ctypes.c_void_p, ctypes.c_ssize_t]
+try:
+    _strlen = ctypes.CDLL(None).strlen
+except (OSError, TypeError):
+    # Windows has no global symbol namespace; use the C runtime directly
+    _strlen = ctypes.cdll.msvcrt.strlen
+_strlen.restype = ctypes.c_size_t
+_strlen.argtypes = [ctypes.c_void_p]
+
+
+def decode_c_str(ptr) -> str:
+    """Decode a raw char* address returned by liblsl into a str."""
+    if not ptr:
+        return ""
+    return _PyUnicode_FromStringAndSize(ptr, _strlen(ptr))
+
+
+# set function prototypes where necessary; declaring both restype and
+# argtypes lets ctypes use its specialized converters instead of deducing
+# the conversion per argument on every call
 lib.lsl_local_clock.restype = ctypes.c_double
 lib.lsl_create_streaminfo.restype = ctypes.c_void_p
+lib.lsl_create_streaminfo.argtypes = [
+    ctypes.c_char_p,
+    ctypes.c_char_p,
+    ctypes.c_int,
+    ctypes.c_double,
+    ctypes.c_int,
+    ctypes.c_char_p,
+]
+lib.lsl_destroy_streaminfo.argtypes = [ctypes.c_void_p]
+lib.lsl_copy_streaminfo.restype = ctypes.c_void_p
+lib.lsl_copy_streaminfo.argtypes = [ctypes.c_void_p]
+lib.lsl_streaminfo_from_xml.restype = ctypes.c_void_p
+lib.lsl_streaminfo_from_xml.argtypes = [ctypes.c_char_p]
 lib.lsl_library_info.restype = ctypes.c_char_p
-lib.lsl_get_name.restype = ctypes.c_char_p
-lib.lsl_get_type.restype = ctypes.c_char_p
+lib.lsl_get_name.restype = ctypes.c_void_p
+lib.lsl_get_name.argtypes = [ctypes.c_void_p]
+lib.lsl_get_type.restype = ctypes.c_void_p
+lib.lsl_get_type.argtypes = [ctypes.c_void_p]
+lib.lsl_get_channel_count.argtypes = [ctypes.c_void_p]
 lib.lsl_get_nominal_srate.restype = ctypes.c_double
-lib.lsl_get_source_id.restype = ctypes.c_char_p
+lib.lsl_get_nominal_srate.argtypes = [ctypes.c_void_p]
+lib.lsl_get_channel_format.argtypes = [ctypes.c_void_p]
+lib.lsl_get_source_id.restype = ctypes.c_void_p
+lib.lsl_get_source_id.argtypes = [ctypes.c_void_p]
+lib.lsl_get_version.argtypes = [ctypes.c_void_p]
 lib.lsl_get_created_at.restype = ctypes.c_double
-lib.lsl_get_uid.restype = ctypes.c_char_p
-lib.lsl_get_session_id.restype = ctypes.c_char_p
-lib.lsl_get_hostname.restype = ctypes.c_char_p
+lib.lsl_get_created_at.argtypes = [ctypes.c_void_p]
+lib.lsl_get_uid.restype = ctypes.c_void_p
+lib.lsl_get_uid.argtypes = [ctypes.c_void_p]
+lib.lsl_get_session_id.restype = ctypes.c_void_p
+lib.lsl_get_session_id.argtypes = [ctypes.c_void_p]
+lib.lsl_get_hostname.restype = ctypes.c_void_p
+lib.lsl_get_hostname.argtypes = [ctypes.c_void_p]
 lib.lsl_get_desc.restype = ctypes.c_void_p
-lib.lsl_get_xml.restype = ctypes.c_char_p
+lib.lsl_get_desc.argtypes = [ctypes.c_void_p]
+lib.lsl_get_xml.restype = ctypes.c_void_p
+lib.lsl_get_xml.argtypes = [ctypes.c_void_p]
+lib.lsl_empty.restype = ctypes.c_bool
+lib.lsl_empty.argtypes = [ctypes.c_void_p]
+lib.lsl_is_text.restype = ctypes.c_bool
+lib.lsl_is_text.argtypes = [ctypes.c_void_p]
 lib.lsl_create_outlet.restype = ctypes.c_void_p
 lib.lsl_create_inlet.restype = ctypes.c_void_p
+lib.lsl_create_inlet.argtypes = [
+    ctypes.c_void_p,
+    ctypes.c_int,
+    ctypes.c_int,
+    ctypes.c_int,
+]
+lib.lsl_destroy_inlet.argtypes = [ctypes.c_void_p]
 lib.lsl_get_fullinfo.restype = ctypes.c_void_p
+lib.lsl_get_fullinfo.argtypes = [
+    ctypes.c_void_p,
+    ctypes.c_double,
+    ctypes.POINTER(ctypes.c_int),
+]
 lib.lsl_get_info.restype = ctypes.c_void_p
 lib.lsl_open_stream.restype = ctypes.c_void_p
+lib.lsl_open_stream.argtypes = [
+    ctypes.c_void_p,
+    ctypes.c_double,
+    ctypes.POINTER(ctypes.c_int),
+]
+lib.lsl_close_stream.argtypes = [ctypes.c_void_p]
 lib.lsl_time_correction.restype = ctypes.c_double
+lib.lsl_time_correction.argtypes = [
+    ctypes.c_void_p,
+    ctypes.c_double,
+    ctypes.POINTER(ctypes.c_int),
+]
+lib.lsl_samples_available.restype = ctypes.c_uint32
+lib.lsl_samples_available.argtypes = [ctypes.c_void_p]
+lib.lsl_inlet_flush.restype = ctypes.c_uint32
+lib.lsl_inlet_flush.argtypes = [ctypes.c_void_p]
+lib.lsl_was_clock_reset.restype = ctypes.c_uint32
+lib.lsl_was_clock_reset.argtypes = [ctypes.c_void_p]
+lib.lsl_set_postprocessing.restype = ctypes.c_int
+lib.lsl_set_postprocessing.argtypes = [ctypes.c_void_p, ctypes.c_uint32]
 lib.lsl_pull_sample_f.restype = ctypes.c_double
 lib.lsl_pull_sample_d.restype = ctypes.c_double
 lib.lsl_pull_sample_l.restype = ctypes.c_double
@@ -179,6 +275,25 @@ lib.lsl_pull_sample_s.restype = ctypes.c_double
 lib.lsl_pull_sample_c.restype = ctypes.c_double
 lib.lsl_pull_sample_str.restype = ctypes.c_double
 lib.lsl_pull_sample_buf.restype = ctypes.c_double
+
+
+def _pull_sample_argtypes(value_type):
+    return [
+        ctypes.c_void_p,
+        ctypes.POINTER(value_type),
+        ctypes.c_int,
+        ctypes.c_double,
+        ctypes.POINTER(ctypes.c_int),
+    ]
+
+
+lib.lsl_pull_sample_f.argtypes = _pull_sample_argtypes(ctypes.c_float)
+lib.lsl_pull_sample_d.argtypes = _pull_sample_argtypes(ctypes.c_double)
+lib.lsl_pull_sample_l.argtypes = _pull_sample_argtypes(ctypes.c_longlong)
+lib.lsl_pull_sample_i.argtypes = _pull_sample_argtypes(ctypes.c_int)
+lib.lsl_pull_sample_s.argtypes = _pull_sample_argtypes(ctypes.c_short)
+lib.lsl_pull_sample_c.argtypes = _pull_sample_argtypes(ctypes.c_byte)
+lib.lsl_pull_sample_str.argtypes = _pull_sample_argtypes(ctypes.c_char_p)
 lib.lsl_first_child.restype = ctypes.c_void_p
 lib.lsl_first_child.argtypes = [
     ctypes.c_void_p,
@@ -205,19 +320,19 @@ lib.lsl_next_sibling_n.restype = ctypes.c_void_p
 lib.lsl_next_sibling_n.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
 lib.lsl_previous_sibling_n.restype = ctypes.c_void_p
 lib.lsl_previous_sibling_n.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
-lib.lsl_name.restype = ctypes.c_char_p
+lib.lsl_name.restype = ctypes.c_void_p
 lib.lsl_name.argtypes = [
     ctypes.c_void_p,
 ]
-lib.lsl_value.restype = ctypes.c_char_p
+lib.lsl_value.restype = ctypes.c_void_p
 lib.lsl_value.argtypes = [
     ctypes.c_void_p,
 ]
-lib.lsl_child_value.restype = ctypes.c_char_p
+lib.lsl_child_value.restype = ctypes.c_void_p
 lib.lsl_child_value.argtypes = [
     ctypes.c_void_p,
 ]
-lib.lsl_child_value_n.restype = ctypes.c_char_p
+lib.lsl_child_value_n.restype = ctypes.c_void_p
 lib.lsl_child_value_n.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
 lib.lsl_append_child_value.restype = ctypes.c_void_p
 lib.lsl_append_child_value.argtypes = [
@@ -231,9 +346,12 @@ lib.lsl_prepend_child_value.argtypes = [
     ctypes.c_char_p,
     ctypes.c_char_p,
 ]
-# Return type for lsl_set_child_value, lsl_set_name, lsl_set_value is int
+# lsl_set_child_value, lsl_set_name, lsl_set_value return an int that is
+# only ever used as a success flag
 lib.lsl_set_child_value.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p]
+lib.lsl_set_name.restype = ctypes.c_bool
 lib.lsl_set_name.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
+lib.lsl_set_value.restype = ctypes.c_bool
 lib.lsl_set_value.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
 lib.lsl_append_child.restype = ctypes.c_void_p
 lib.lsl_append_child.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
@@ -256,15 +374,34 @@ try:
     lib.lsl_pull_chunk_c.restype = ctypes.c_long
     lib.lsl_pull_chunk_str.restype = ctypes.c_long
     lib.lsl_pull_chunk_buf.restype = ctypes.c_long
+
+    def _pull_chunk_argtypes(value_type):
+        return [
+            ctypes.c_void_p,
+            ctypes.POINTER(value_type),
+            ctypes.POINTER(ctypes.c_double),
+            ctypes.c_size_t,
+            ctypes.c_size_t,
+            ctypes.c_double,
+            ctypes.POINTER(ctypes.c_int),
+        ]
+
+    lib.lsl_pull_chunk_f.argtypes = _pull_chunk_argtypes(ctypes.c_float)
+    lib.lsl_pull_chunk_d.argtypes = _pull_chunk_argtypes(ctypes.c_double)
+    lib.lsl_pull_chunk_l.argtypes = _pull_chunk_argtypes(ctypes.c_longlong)
+    lib.lsl_pull_chunk_i.argtypes = _pull_chunk_argtypes(ctypes.c_int)
+    lib.lsl_pull_chunk_s.argtypes = _pull_chunk_argtypes(ctypes.c_short)
+    lib.lsl_pull_chunk_c.argtypes = _pull_chunk_argtypes(ctypes.c_byte)
+    lib.lsl_pull_chunk_str.argtypes = _pull_chunk_argtypes(ctypes.c_char_p)
 except Exception:
-    print("pylsl: chunk transfer functions not available in your liblsl " "version.")
+    print("pylsl: chunk transfer functions not available in your liblsl version.")
 # noinspection PyBroadException
 try:
     lib.lsl_create_continuous_resolver.restype = ctypes.c_void_p
     lib.lsl_create_continuous_resolver_bypred.restype = ctypes.c_void_p
     lib.lsl_create_continuous_resolver_byprop.restype = ctypes.c_void_p
 except Exception:
-    print("pylsl: ContinuousResolver not (fully) available in your liblsl " "version.")
+    print("pylsl: ContinuousResolver not (fully) available in your liblsl version.")
 
 
 # int64 support on windows and 32bit OSes isn't there yet
@@ -314,6 +451,16 @@ fmt2type = [
     ctypes.c_byte,
     ctypes.c_longlong,
 ]
+fmt2numpy = [
+    None,
+    np.float32,
+    np.float64,
+    None,  # strings are decoded individually; no numpy fast path
+    np.int32,
+    np.int16,
+    np.int8,
+    np.int64,
+]
 fmt2push_sample = [
     [],
     lib.lsl_push_sample_ftp,
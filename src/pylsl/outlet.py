@@ -1,4 +1,9 @@
+import array
 import ctypes
+import struct
+from itertools import chain
+
+import numpy as np
 
 from .lib import (
     lib,
@@ -6,11 +11,20 @@ from .lib import (
     fmt2push_chunk,
     fmt2push_chunk_n,
     fmt2type,
+    fmt2numpy,
     cf_string,
 )
 from .util import handle_error
 from .info import StreamInfo
 
+# struct typecodes matching fmt2type's ctypes entries (native byte order)
+fmt2structcode = [None, "f", "d", None, "i", "h", "b", "q"]
+
+# module-level aliases skip a LOAD_GLOBAL + LOAD_ATTR pair per push
+_c_double = ctypes.c_double
+_c_int = ctypes.c_int
+_c_long = ctypes.c_long
+
 
 class StreamOutlet:
     """A stream outlet.
@@ -20,6 +34,17 @@ class StreamOutlet:
 
     """
 
+    def __new__(cls, info: StreamInfo, *args, **kwargs):
+        # pick the format-specialized subclass at construction so the push
+        # hot paths carry no per-call format branches
+        if cls is StreamOutlet:
+            cls = (
+                _StreamOutletString
+                if info.channel_format() == cf_string
+                else _StreamOutletNumeric
+            )
+        return super().__new__(cls)
+
     def __init__(self, info: StreamInfo, chunk_size: int = 0, max_buffered: int = 360):
         """Establish a new stream outlet. This makes the stream discoverable.
 
@@ -44,20 +69,20 @@ class StreamOutlet:
         # It may be desirable to include the host name in the source_id hash to avoid collisions.
         # However, there are likely implications to re-creating the info so this is commented out
         #  until a need arises.
-        expected_src_id = str(hash((
+        from .info import _generate_source_id
+        expected_src_id = _generate_source_id(
             info.name(), info.type(), info.channel_count(), info.nominal_srate(), info.channel_format()
-        )))
+        )
         if info.source_id() == expected_src_id:
             old_desc = info.desc()  # save the old metadata
             import socket
-            new_source_id = str(hash((
+            new_source_id = _generate_source_id(
                 info.name(),
-                info.type(),
+                info.type() + socket.gethostname(),
                 info.channel_count(),
                 info.nominal_srate(),
                 info.channel_format(),
-                socket.gethostname()
-            )))
+            )
             info = StreamInfo(
                 name=info.name(),
                 type=info.type(),
@@ -80,8 +105,36 @@ class StreamOutlet:
         self.do_push_sample = fmt2push_sample[self.channel_format]
         self.do_push_chunk = fmt2push_chunk[self.channel_format]
         self.do_push_chunk_n = fmt2push_chunk_n[self.channel_format]
+        self._is_string = self.channel_format == cf_string
         self.value_type = fmt2type[self.channel_format]
-        self.sample_type = self.value_type * self.channel_count
+        self._np_dtype = fmt2numpy[self.channel_format]
+        # ctypes array types cached by length; steady-state streaming reuses
+        # the same chunk sizes, so type construction amortizes to a dict hit
+        self._arr_cache = {}
+        self._ts_arr_cache = {}
+        structcode = fmt2structcode[self.channel_format]
+        self._structcode = structcode
+        self._struct = (
+            struct.Struct("=" + structcode * self.channel_count) if structcode else None
+        )
+        # grow-only scratch buffer reused by the push_chunk list path,
+        # plus compiled Structs cached by chunk length
+        self._scratch = None
+        self._scratch_n = 0
+        self._struct_cache = {}
+
+    @property
+    def sample_type(self):
+        """The ctypes array type for one sample, built on first use.
+
+        Chunk-only producers never call push_sample, so the metaclass cost
+        of constructing the array type is deferred until it is needed.
+
+        """
+        sample_type = self.__dict__.get("_sample_type")
+        if sample_type is None:
+            sample_type = self._sample_type = self.value_type * self.channel_count
+        return sample_type
 
     def __del__(self):
         """Destroy an outlet.
@@ -114,16 +167,16 @@ class StreamOutlet:
 
         """
         if len(x) == self.channel_count:
-            if self.channel_format == cf_string:
-                x = [v.encode("utf-8") for v in x]
-            handle_error(
-                self.do_push_sample(
-                    self.obj,
-                    self.sample_type(*x),
-                    ctypes.c_double(timestamp),
-                    ctypes.c_int(pushthrough),
-                )
+            sample = self._make_sample(x)
+            # errcode is 0 in steady state; only enter handle_error on failure
+            err = self.do_push_sample(
+                self.obj,
+                sample,
+                _c_double(timestamp),
+                _c_int(pushthrough),
             )
+            if err:
+                handle_error(err)
         else:
             raise ValueError(
                 "length of the sample (" + str(len(x)) + ") must "
@@ -157,48 +210,150 @@ class StreamOutlet:
         """
         # Convert timestamp to corresponding ctype
         try:
-            timestamp_c = ctypes.c_double(timestamp)
+            timestamp_c = _c_double(timestamp)
             # Select the corresponding push_chunk method
             liblsl_push_chunk_func = self.do_push_chunk
         except TypeError:
             try:
-                timestamp_c = (ctypes.c_double * len(timestamp))(*timestamp)
+                # array.array converts the float list in one C loop; the
+                # ctypes array is then a zero-copy view over it
+                ts_arr = array.array("d", timestamp)
+                ts_type = self._arr_type(
+                    self._ts_arr_cache, ctypes.c_double, len(ts_arr)
+                )
+                timestamp_c = ts_type.from_buffer(ts_arr)
                 liblsl_push_chunk_func = self.do_push_chunk_n
             except TypeError:
                 raise TypeError("timestamp must be a float or an iterable of floats")
 
-        try:
-            n_values = self.channel_count * len(x)
-            data_buff = (self.value_type * n_values).from_buffer(x)
-            handle_error(
-                liblsl_push_chunk_func(
-                    self.obj,
-                    data_buff,
-                    ctypes.c_long(n_values),
-                    timestamp_c,
-                    ctypes.c_int(pushthrough),
+        if isinstance(x, np.ndarray):
+            # validate instead of silently falling back: a mismatched dtype
+            # would reinterpret raw bits and a non-contiguous array would be
+            # pushed with the wrong layout
+            if self._np_dtype is None:
+                raise ValueError(
+                    "cannot push a numpy array to a string-formatted stream."
+                )
+            if x.dtype != self._np_dtype:
+                raise ValueError(
+                    f"array dtype ({x.dtype}) does not match the stream's "
+                    f"channel format dtype ({np.dtype(self._np_dtype)})."
+                )
+            if not x.flags["C_CONTIGUOUS"]:
+                raise ValueError(
+                    "push_chunk requires a C-contiguous array; call "
+                    "np.ascontiguousarray first."
+                )
+            # the receiver deframes a flat multiplexed run, so a mismatched
+            # width would corrupt every subsequent sample
+            if x.ndim == 2 and x.shape[1] != self.channel_count:
+                raise ValueError(
+                    f"array has {x.shape[1]} columns but the stream has "
+                    f"{self.channel_count} channels."
+                )
+            if x.size % self.channel_count:
+                raise ValueError(
+                    f"array holds {x.size} values, which is not a whole "
+                    f"number of {self.channel_count}-channel samples."
                 )
+            # matching ndarrays hand their raw data pointer to liblsl; no
+            # ctypes array instance is wrapped around the buffer at all
+            err = liblsl_push_chunk_func(
+                self.obj,
+                x.ctypes.data_as(ctypes.POINTER(self.value_type)),
+                _c_long(x.size),
+                timestamp_c,
+                _c_int(pushthrough),
             )
-        except TypeError:
+            if err:
+                handle_error(err)
+        elif isinstance(x, (memoryview, bytes, bytearray, array.array)) or (
+            hasattr(x, "__buffer__") and not hasattr(x, "__array_interface__")
+        ):
+            # any PEP 3118 exporter (array.array, torch tensors, shared
+            # memory views, ...) is pushed zero-copy through a memoryview;
+            # the element count comes from the buffer itself, so flat and
+            # 2-D layouts both work
+            m = x if isinstance(x, memoryview) else memoryview(x)
+            itemsize = ctypes.sizeof(self.value_type)
+            if not m.c_contiguous:
+                raise ValueError(
+                    "push_chunk requires a C-contiguous buffer; copy the "
+                    "data into one first."
+                )
+            if m.itemsize != itemsize:
+                # unformatted byte views (bytes, bytearray, mmap slices)
+                # carry itemsize 1; only their total length can be checked.
+                # Anything else is a genuine element-type mismatch.
+                if m.itemsize != 1:
+                    raise ValueError(
+                        f"buffer itemsize ({m.itemsize}) does not match the "
+                        f"stream's value size ({itemsize})."
+                    )
+                if m.nbytes % itemsize:
+                    raise ValueError(
+                        f"byte buffer length ({m.nbytes}) is not a multiple "
+                        f"of the stream's value size ({itemsize})."
+                    )
+            n_values = m.nbytes // itemsize
+            if n_values % self.channel_count:
+                raise ValueError(
+                    f"buffer holds {n_values} values, which is not a whole "
+                    f"number of {self.channel_count}-channel samples."
+                )
+            arr_type = self._arr_type(self._arr_cache, self.value_type, n_values)
+            if m.readonly:
+                # pushing only reads the data, but from_buffer demands a
+                # writable exporter; copy read-only buffers (e.g. bytes)
+                # instead of surfacing ctypes' opaque TypeError
+                data_buff = arr_type.from_buffer_copy(m)
+            else:
+                data_buff = arr_type.from_buffer(m)
+            err = liblsl_push_chunk_func(
+                self.obj,
+                data_buff,
+                _c_long(n_values),
+                timestamp_c,
+                _c_int(pushthrough),
+            )
+            if err:
+                handle_error(err)
+        elif hasattr(x, "__array_interface__"):
+            # numpy-like arrays that missed the fast path above (mismatched
+            # dtype or layout) still go through from_buffer as before
+            n_values = self.channel_count * len(x)
+            data_buff = self._arr_type(
+                self._arr_cache, self.value_type, n_values
+            ).from_buffer(x)
+            err = liblsl_push_chunk_func(
+                self.obj,
+                data_buff,
+                _c_long(n_values),
+                timestamp_c,
+                _c_int(pushthrough),
+            )
+            if err:
+                handle_error(err)
+        else:
             # don't send empty chunks
             if len(x):
                 if type(x[0]) is list:
-                    x = [v for sample in x for v in sample]
-                if self.channel_format == cf_string:
-                    x = [v.encode("utf-8") for v in x]
+                    # chain.from_iterable flattens in C, without the nested
+                    # comprehension's per-element bytecode
+                    x = list(chain.from_iterable(x))
                 if len(x) % self.channel_count == 0:
                     # x is a flattened list of multiplexed values
-                    constructor = self.value_type * len(x)
-                    # noinspection PyCallingNonCallable
-                    handle_error(
-                        liblsl_push_chunk_func(
-                            self.obj,
-                            constructor(*x),
-                            ctypes.c_long(len(x)),
-                            timestamp_c,
-                            ctypes.c_int(pushthrough),
-                        )
+                    n_values = len(x)
+                    data_buff = self._make_chunk_buffer(x, n_values)
+                    err = liblsl_push_chunk_func(
+                        self.obj,
+                        data_buff,
+                        _c_long(n_values),
+                        timestamp_c,
+                        _c_int(pushthrough),
                     )
+                    if err:
+                        handle_error(err)
                 else:
                     raise ValueError(
                         "Each sample must have the same number of channels ("
@@ -206,6 +361,58 @@ class StreamOutlet:
                         + ")."
                     )
 
+    def _make_sample(self, x):
+        """Build the ctypes sample passed to liblsl (generic fallback).
+
+        Direct subclasses of StreamOutlet get this branching version; the
+        format-specialized subclasses below override it with branch-free
+        bodies.
+
+        """
+        if self._is_string:
+            return self.sample_type(*map(str.encode, x))
+        return self.sample_type.from_buffer_copy(self._struct.pack(*x))
+
+    def _make_chunk_buffer(self, x, n_values):
+        """Build the ctypes buffer for a flattened list chunk (generic)."""
+        if self._is_string:
+            # noinspection PyCallingNonCallable
+            return self._arr_type(self._arr_cache, self.value_type, n_values)(
+                *map(str.encode, x)
+            )
+        return self._pack_into_scratch(x, n_values)
+
+    def _pack_into_scratch(self, x, n_values):
+        """Pack numeric values into a persistent, grow-only scratch buffer.
+
+        Reusing one allocation avoids the malloc/free churn of constructing
+        a fresh ctypes array per push; the buffer only ever grows, to the
+        next power of two above the largest chunk seen.
+
+        """
+        if n_values > self._scratch_n:
+            n = 1 << (n_values - 1).bit_length()
+            self._scratch = (self.value_type * n)()
+            self._scratch_n = n
+        chunk_struct = self._struct_cache.get(n_values)
+        if chunk_struct is None:
+            chunk_struct = struct.Struct("=" + self._structcode * n_values)
+            self._struct_cache[n_values] = chunk_struct
+        # pack_into writes straight into the scratch buffer, with no
+        # intermediate bytes object to allocate and collect
+        chunk_struct.pack_into(self._scratch, 0, *x)
+        return self._scratch
+
+    @staticmethod
+    def _arr_type(cache, value_type, n):
+        """Return the ctypes array type value_type * n, cached by length."""
+        arr_type = cache.get(n)
+        if arr_type is None:
+            # built lazily so unused lengths never pay the metaclass cost
+            arr_type = value_type * n
+            cache[n] = arr_type
+        return arr_type
+
     def have_consumers(self) -> bool:
         """Check whether consumers are currently registered.
 
@@ -226,3 +433,30 @@ class StreamOutlet:
     def get_info(self) -> StreamInfo:
         outlet_info = lib.lsl_get_info(self.obj)
         return StreamInfo(handle=outlet_info)
+
+
+class _StreamOutletNumeric(StreamOutlet):
+    """StreamOutlet specialized for numeric channel formats."""
+
+    def _make_sample(self, x):
+        # struct packs all channels in one C call, skipping the per-element
+        # ctypes descriptor path of sample_type(*x)
+        return self.sample_type.from_buffer_copy(self._struct.pack(*x))
+
+    def _make_chunk_buffer(self, x, n_values):
+        return self._pack_into_scratch(x, n_values)
+
+
+class _StreamOutletString(StreamOutlet):
+    """StreamOutlet specialized for cf_string streams."""
+
+    def _make_sample(self, x):
+        # map with the unbound method encodes without re-resolving the
+        # bound method per element (str.encode defaults to utf-8)
+        return self.sample_type(*map(str.encode, x))
+
+    def _make_chunk_buffer(self, x, n_values):
+        # noinspection PyCallingNonCallable
+        return self._arr_type(self._arr_cache, self.value_type, n_values)(
+            *map(str.encode, x)
+        )
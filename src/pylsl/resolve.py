@@ -1,9 +1,32 @@
 import ctypes
+import functools
+import threading
 
 from .lib import lib
 from .info import StreamInfo
 from .util import FOREVER
 
+# per-thread handle buffer reused across resolve calls; allocating and
+# zero-filling 8 KiB per call is needless churn for polled resolvers,
+# while a single shared buffer would let concurrent resolves overwrite
+# each other's handle slots
+_local = threading.local()
+
+
+def _resolve_buffer():
+    buf = getattr(_local, "resolve_buf", None)
+    if buf is None:
+        # noinspection PyCallingNonCallable
+        buf = (ctypes.c_void_p * 1024)()
+        _local.resolve_buf = buf
+    return buf
+
+
+@functools.lru_cache(maxsize=256)
+def _enc(s: str) -> bytes:
+    """Encode a query string once; polling resolvers repeat their args."""
+    return s.encode()
+
 
 def resolve_streams(wait_time=1.0):
     """Resolve all streams on the network.
@@ -26,12 +49,12 @@ def resolve_streams(wait_time=1.0):
     retrieved from the inlet.
 
     """
-    # noinspection PyCallingNonCallable
-    buffer = (ctypes.c_void_p * 1024)()
+    buffer = _resolve_buffer()
     num_found = lib.lsl_resolve_all(
         ctypes.byref(buffer), 1024, ctypes.c_double(wait_time)
     )
-    return [StreamInfo(handle=buffer[k]) for k in range(num_found)]
+    handles = ctypes.cast(buffer, ctypes.POINTER(ctypes.c_void_p))[:num_found]
+    return [StreamInfo(handle=h) for h in handles]
 
 
 def resolve_byprop(prop, value, minimum=1, timeout=FOREVER):
@@ -56,17 +79,17 @@ def resolve_byprop(prop, value, minimum=1, timeout=FOREVER):
     Example: results = resolve_Stream_byprop("type","EEG")
 
     """
-    # noinspection PyCallingNonCallable
-    buffer = (ctypes.c_void_p * 1024)()
+    buffer = _resolve_buffer()
     num_found = lib.lsl_resolve_byprop(
         ctypes.byref(buffer),
         1024,
-        ctypes.c_char_p(str.encode(prop)),
-        ctypes.c_char_p(str.encode(value)),
+        ctypes.c_char_p(_enc(prop)),
+        ctypes.c_char_p(_enc(value)),
         minimum,
         ctypes.c_double(timeout),
     )
-    return [StreamInfo(handle=buffer[k]) for k in range(num_found)]
+    handles = ctypes.cast(buffer, ctypes.POINTER(ctypes.c_void_p))[:num_found]
+    return [StreamInfo(handle=h) for h in handles]
 
 
 def resolve_bypred(predicate, minimum=1, timeout=FOREVER):
@@ -90,16 +113,16 @@ def resolve_bypred(predicate, minimum=1, timeout=FOREVER):
     of which can subsequently be used to open an inlet.
 
     """
-    # noinspection PyCallingNonCallable
-    buffer = (ctypes.c_void_p * 1024)()
+    buffer = _resolve_buffer()
     num_found = lib.lsl_resolve_bypred(
         ctypes.byref(buffer),
         1024,
-        ctypes.c_char_p(str.encode(predicate)),
+        ctypes.c_char_p(_enc(predicate)),
         minimum,
         ctypes.c_double(timeout),
     )
-    return [StreamInfo(handle=buffer[k]) for k in range(num_found)]
+    handles = ctypes.cast(buffer, ctypes.POINTER(ctypes.c_void_p))[:num_found]
+    return [StreamInfo(handle=h) for h in handles]
 
 
 class ContinuousResolver:
@@ -128,11 +151,11 @@ class ContinuousResolver:
                     "both."
                 )
             self.obj = lib.lsl_create_continuous_resolver_bypred(
-                str.encode(pred), ctypes.c_double(forget_after)
+                _enc(pred), ctypes.c_double(forget_after)
             )
         elif prop is not None and value is not None:
             self.obj = lib.lsl_create_continuous_resolver_byprop(
-                str.encode(prop), str.encode(value), ctypes.c_double(forget_after)
+                _enc(prop), _enc(value), ctypes.c_double(forget_after)
             )
         elif prop is not None or value is not None:
             raise ValueError(
@@ -160,10 +183,10 @@ class ContinuousResolver:
         field), any of which can subsequently be used to open an inlet.
 
         """
-        # noinspection PyCallingNonCallable
-        buffer = (ctypes.c_void_p * 1024)()
+        buffer = _resolve_buffer()
         num_found = lib.lsl_resolver_results(self.obj, ctypes.byref(buffer), 1024)
-        return [StreamInfo(handle=buffer[k]) for k in range(num_found)]
+        handles = ctypes.cast(buffer, ctypes.POINTER(ctypes.c_void_p))[:num_found]
+        return [StreamInfo(handle=h) for h in handles]
 
 
 def resolve_stream(*args):
@@ -92,19 +92,23 @@ class InternalError(RuntimeError):
     pass
 
 
+# error-code dispatch table; one dict lookup instead of an if/elif chain
+_ERROR_CODES = {
+    -1: (TimeoutError, "the operation failed due to a timeout."),
+    -2: (LostError, "the stream has been lost."),
+    -3: (InvalidArgumentError, "an argument was incorrectly specified."),
+    -4: (InternalError, "an internal error has occurred."),
+}
+
+
 def handle_error(errcode):
     """Error handler function. Translates an error code into an exception."""
     if type(errcode) is ctypes.c_int:
         errcode = errcode.value
     if errcode == 0:
-        pass  # no error
-    elif errcode == -1:
-        raise TimeoutError("the operation failed due to a timeout.")
-    elif errcode == -2:
-        raise LostError("the stream has been lost.")
-    elif errcode == -3:
-        raise InvalidArgumentError("an argument was incorrectly specified.")
-    elif errcode == -4:
-        raise InternalError("an internal error has occurred.")
-    elif errcode < 0:
+        return  # no error
+    error = _ERROR_CODES.get(errcode)
+    if error is not None:
+        raise error[0](error[1])
+    if errcode < 0:
         raise RuntimeError("an unknown error has occurred.")
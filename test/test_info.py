@@ -1,32 +1,81 @@
-import pylsl
+import io
+import os
+import xml.etree.ElementTree as ET
 
+import pytest
+
+from pylsl import StreamInfo, StreamOutlet, cf_float32
+from pylsl.info import _generate_source_id
+
+# expected channel labels, formatted once at import and sliced per case
+_CH_LABELS = tuple(f"Ch{i}" for i in range(1, 33))
 
-def test_info_src_id():
-    name = "TestName"
-    strm_type = "TestType"
-    chans = 32
-    srate = 1000.0
-    fmt = pylsl.cf_float32
 
-    info = pylsl.StreamInfo(
-        name=name,
-        type=strm_type,
+def _labels_from_xml(xml_bytes):
+    """Extract channel labels from a stream_info XML document.
+
+    Uses a single iterparse pass over "end" events and clears each element
+    after reading it, so memory stays flat regardless of channel count
+    (full-DOM parsing grows linearly with high-channel-count streams).
+    """
+    labels = []
+    for _, elem in ET.iterparse(io.BytesIO(xml_bytes), events=("end",)):
+        if elem.tag == "label":
+            labels.append(elem.text)
+        elem.clear()
+    return labels
+
+
+def _make_info(chans):
+    info = StreamInfo(
+        name="TestName",
+        type="TestType",
         channel_count=chans,
-        nominal_srate=srate,
-        channel_format=fmt,
+        nominal_srate=1000.0,
+        channel_format=cf_float32,
         source_id=None,
     )
-    expected_src_id = str(hash((name, strm_type, chans, srate, fmt)))
+    info.desc().append_child_value("manufacturer", "pytest")
+    info.set_channel_labels(list(_CH_LABELS[:chans]))
+    return info
+
+
+@pytest.mark.parametrize("chans", [1, 8, 32])
+def test_info_src_id(chans):
+    expected_src_id = _generate_source_id(
+        "TestName", "TestType", chans, 1000.0, cf_float32
+    )
+    info = _make_info(chans)
     assert info.source_id() == expected_src_id
 
-    # Augment info with desc
-    info.desc().append_child_value("manufacturer", "pytest")
-    chns = info.desc().append_child("channels")
-    for chan_ix in range(1, chans + 1):
-        ch = chns.append_child("channel")
-        ch.append_child_value("label", f"Ch{chan_ix}")
+    # serialization round-trip through liblsl's XML form; a pure metadata
+    # operation that needs no outlet, sockets or multicast
+    xml = info.as_xml()
+    parsed_info = StreamInfo.from_xml(xml)
+    assert parsed_info.source_id() == expected_src_id
+    assert parsed_info.desc().child_value("manufacturer") == "pytest"
+    assert tuple(parsed_info.get_channel_labels()) == _CH_LABELS[:chans]
+
+    # cross-check the pugixml-backed accessor against an independent
+    # streaming parse of the same document
+    assert tuple(_labels_from_xml(xml.encode("utf-8"))) == _CH_LABELS[:chans]
+
+    # copy() duplicates the liblsl object directly, without reserialization
+    copied_info = info.copy()
+    assert copied_info.source_id() == expected_src_id
+    assert tuple(copied_info.get_channel_labels()) == _CH_LABELS[:chans]
 
-    outlet = pylsl.StreamOutlet(info)
+
+@pytest.mark.skipif(
+    bool(os.environ.get("LSL_SKIP_NET")),
+    reason="LSL_SKIP_NET is set; outlet construction opens UDP sockets and "
+    "probes network interfaces, which test_info_src_id already avoids",
+)
+def test_outlet_roundtrip():
+    chans = 32
+    info = _make_info(chans)
+
+    outlet = StreamOutlet(info)
     outlet_info = outlet.get_info()
 
     """
@@ -34,11 +83,7 @@ def test_info_src_id():
     import socket
     outlet_expected_source_id = str(hash((name, strm_type, chans, srate, fmt, socket.gethostname())))
     """
-    outlet_expected_source_id = expected_src_id
-
-    assert outlet_info.source_id() == outlet_expected_source_id
+    assert outlet_info.source_id() == info.source_id()
     out_desc = outlet_info.desc()
     assert out_desc.child_value("manufacturer") == "pytest"
-    assert outlet_info.get_channel_labels() == [
-        f"Ch{chan_ix}" for chan_ix in range(1, chans + 1)
-    ]
+    assert tuple(outlet_info.get_channel_labels()) == _CH_LABELS[:chans]
@@ -0,0 +1,143 @@
+import os
+import time
+
+import numpy as np
+import pytest
+
+import pylsl
+
+# outlet/inlet pairs exercise real UDP multicast and TCP transport; skip
+# wholesale on hosts without a usable network (see test_info.py)
+pytestmark = pytest.mark.skipif(
+    bool(os.environ.get("LSL_SKIP_NET")),
+    reason="LSL_SKIP_NET is set; loopback streaming needs working sockets",
+)
+
+_TIMEOUT = 5.0
+
+
+def _make_pair(channel_format, source_id, channel_count=4):
+    """Create a connected outlet/inlet pair on the local machine."""
+    info = pylsl.StreamInfo(
+        name="pylsl_loopback",
+        type="Test",
+        channel_count=channel_count,
+        nominal_srate=pylsl.IRREGULAR_RATE,
+        channel_format=channel_format,
+        source_id=source_id,
+    )
+    outlet = pylsl.StreamOutlet(info)
+    streams = pylsl.resolve_byprop("source_id", source_id, timeout=_TIMEOUT)
+    assert streams, "loopback stream did not resolve"
+    inlet = pylsl.StreamInlet(streams[0])
+    inlet.open_stream(timeout=_TIMEOUT)
+    return outlet, inlet
+
+
+def _wait_for_samples(inlet, n_samples):
+    """Wait until at least n_samples are buffered on the inlet."""
+    deadline = time.monotonic() + _TIMEOUT
+    while inlet.samples_available() < n_samples:
+        if time.monotonic() > deadline:
+            raise TimeoutError("samples did not arrive within the deadline")
+        time.sleep(0.01)
+
+
+def _pull_chunk_all(inlet, n_samples, **kwargs):
+    """Accumulate pull_chunk results until n_samples have arrived."""
+    samples, timestamps = [], []
+    deadline = time.monotonic() + _TIMEOUT
+    while len(samples) < n_samples and time.monotonic() < deadline:
+        chunk, ts = inlet.pull_chunk(timeout=0.5, **kwargs)
+        samples.extend(chunk)
+        timestamps.extend(ts)
+    return samples, timestamps
+
+
+def test_pull_sample_roundtrip():
+    outlet, inlet = _make_pair(pylsl.cf_float32, "loopback_pull_sample")
+    pushed = [[1.0, -2.0, 3.5, 0.25], [4.0, 5.0, -6.5, 0.125]]
+    for sample in pushed:
+        outlet.push_sample(sample)
+    for expected in pushed:
+        sample, timestamp = inlet.pull_sample(timeout=_TIMEOUT)
+        assert timestamp is not None
+        assert sample == pytest.approx(expected)
+
+
+def test_pull_chunk_list_push():
+    outlet, inlet = _make_pair(pylsl.cf_int32, "loopback_chunk_list")
+    pushed = [[s * 10 + c for c in range(4)] for s in range(8)]
+    outlet.push_chunk(pushed)
+    samples, timestamps = _pull_chunk_all(inlet, len(pushed))
+    assert samples == pushed
+    assert len(timestamps) == len(pushed)
+
+
+def test_pull_chunk_numpy_push():
+    outlet, inlet = _make_pair(pylsl.cf_float32, "loopback_chunk_numpy")
+    pushed = np.arange(32, dtype=np.float32).reshape(8, 4)
+    outlet.push_chunk(pushed)
+    samples, _ = _pull_chunk_all(inlet, len(pushed))
+    assert np.allclose(np.asarray(samples, dtype=np.float32), pushed)
+
+
+def test_pull_chunk_readonly_push():
+    outlet, inlet = _make_pair(pylsl.cf_float32, "loopback_chunk_readonly")
+    pushed = np.arange(32, dtype=np.float32).reshape(8, 4)
+    # bytes is a read-only PEP 3118 exporter; push copies it internally
+    outlet.push_chunk(pushed.tobytes())
+    samples, _ = _pull_chunk_all(inlet, len(pushed))
+    assert np.allclose(np.asarray(samples, dtype=np.float32), pushed)
+
+
+def test_pull_chunk_dest_obj():
+    outlet, inlet = _make_pair(pylsl.cf_float32, "loopback_chunk_dest")
+    pushed = np.arange(32, dtype=np.float32).reshape(8, 4)
+    outlet.push_chunk(pushed)
+    _wait_for_samples(inlet, len(pushed))
+    dest = np.zeros_like(pushed)
+    samples, timestamps = inlet.pull_chunk(
+        timeout=_TIMEOUT, max_samples=len(pushed), dest_obj=dest
+    )
+    assert samples is None
+    assert len(timestamps) == len(pushed)
+    assert np.allclose(dest, pushed)
+
+
+def test_pull_chunk_np():
+    outlet, inlet = _make_pair(pylsl.cf_float32, "loopback_chunk_np")
+    pushed = np.arange(32, dtype=np.float32).reshape(8, 4)
+    outlet.push_chunk(pushed)
+    _wait_for_samples(inlet, len(pushed))
+    samples, timestamps = inlet.pull_chunk_np(timeout=_TIMEOUT, max_samples=len(pushed))
+    assert samples.shape == pushed.shape
+    assert timestamps.shape == (len(pushed),)
+    assert np.allclose(samples, pushed)
+
+
+def test_pull_chunk_into():
+    outlet, inlet = _make_pair(pylsl.cf_double64, "loopback_chunk_into")
+    pushed = np.arange(32, dtype=np.float64).reshape(8, 4)
+    outlet.push_chunk(pushed)
+    _wait_for_samples(inlet, len(pushed))
+    data = np.zeros_like(pushed)
+    ts = np.zeros(len(pushed), dtype=np.float64)
+    num_samples = inlet.pull_chunk_into(data, ts, timeout=_TIMEOUT)
+    assert num_samples == len(pushed)
+    assert np.allclose(data, pushed)
+    assert np.all(ts > 0)
+
+
+def test_string_roundtrip():
+    outlet, inlet = _make_pair(pylsl.cf_string, "loopback_string", channel_count=2)
+    outlet.push_sample(["hello", "world"])
+    sample, timestamp = inlet.pull_sample(timeout=_TIMEOUT)
+    assert timestamp is not None
+    assert sample == ["hello", "world"]
+
+    pushed = [[f"s{s}c{c}" for c in range(2)] for s in range(4)]
+    outlet.push_chunk(pushed)
+    samples, timestamps = _pull_chunk_all(inlet, len(pushed))
+    assert samples == pushed
+    assert len(timestamps) == len(pushed)